@@ -724,12 +724,13 @@ class NewGenZAppPlus:
         # Convert framework result to workflow steps
         workflow_steps = []
         
-        for i, agent_info in enumerate(framework_result['optimized_sequence']):
-            agent_name = agent_info['agent_name']
-            
-            # Generate AI-powered action for each agent
-            action_prompt = f"""
-            You are a {agent_name} in an insurance workflow. Generate a specific action for this task:
+        optimized_sequence = framework_result['optimized_sequence']
+        
+        # Generate AI-powered actions for all agents; the prompts are independent,
+        # so they are sent concurrently
+        action_prompts = [
+            f"""
+            You are a {agent_info['agent_name']} in an insurance workflow. Generate a specific action for this task:
             
             Task: "{task}"
             Context: {json.dumps(context)}
@@ -739,28 +740,42 @@ class NewGenZAppPlus:
             Generate a specific, actionable step that this agent would perform.
             Return only the action description (1-2 sentences).
             """
-            
-            try:
-                response = self.openai_client.get_chat_completion(action_prompt)
-                action = response.get('response', f'Perform {agent_name} analysis for the task')
-            except:
-                action = f'Perform {agent_name} analysis and provide recommendations'
-            
-            # Generate AI-powered result
-            result_prompt = f"""
-            As a {agent_name}, provide a realistic result for this action:
+            for agent_info in optimized_sequence
+        ]
+        
+        try:
+            action_responses = self.openai_client.get_chat_completions(action_prompts)
+            actions = [
+                response.get('response', f"Perform {agent_info['agent_name']} analysis for the task")
+                for agent_info, response in zip(optimized_sequence, action_responses)
+            ]
+        except:
+            actions = [f"Perform {agent_info['agent_name']} analysis and provide recommendations" for agent_info in optimized_sequence]
+        
+        # Generate AI-powered results, each from its agent's action
+        result_prompts = [
+            f"""
+            As a {agent_info['agent_name']}, provide a realistic result for this action:
             Action: "{action}"
             Task: "{task}"
             
             Generate a brief, realistic result that this agent would produce.
             Return only the result description (1-2 sentences).
             """
-            
-            try:
-                response = self.openai_client.get_chat_completion(result_prompt)
-                result = response.get('response', f'{agent_name} analysis completed successfully')
-            except:
-                result = f'{agent_name} has completed the assigned task with positive outcome'
+            for agent_info, action in zip(optimized_sequence, actions)
+        ]
+        
+        try:
+            result_responses = self.openai_client.get_chat_completions(result_prompts)
+            results = [
+                response.get('response', f"{agent_info['agent_name']} analysis completed successfully")
+                for agent_info, response in zip(optimized_sequence, result_responses)
+            ]
+        except:
+            results = [f"{agent_info['agent_name']} has completed the assigned task with positive outcome" for agent_info in optimized_sequence]
+        
+        for i, (agent_info, action, result) in enumerate(zip(optimized_sequence, actions, results)):
+            agent_name = agent_info['agent_name']
             
             # Generate reasoning steps
             reasoning_steps = [
@@ -773,7 +788,7 @@ class NewGenZAppPlus:
                 'agent': agent_name,
                 'action': action,
                 'estimated_duration': agent_info['estimated_duration'],
-                'confidence': 0.85 + (0.1 * (5 - len(framework_result['optimized_sequence']))),  # Higher confidence with fewer agents
+                'confidence': 0.85 + (0.1 * (5 - len(optimized_sequence))),  # Higher confidence with fewer agents
                 'reasoning_steps': reasoning_steps,
                 'result': result,
                 'credits_used': agent_info['credit_cost'],
@@ -4,22 +4,228 @@ Integrates Environmental, Social, and Governance factors for comprehensive risk
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
 import streamlit as st
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+import math
+import re
 import numpy as np
 
+
+@st.cache_data(ttl=3600, max_entries=128)
+def _cached_esg_climate_risk_score(_framework: 'ESGClimateRiskFramework', location_data: Dict,
+                                   weather_data: Dict, economic_data: Dict) -> Dict[str, Any]:
+    """Memoized ESG scoring, keyed by the three input payloads"""
+    return _framework._compute_esg_climate_risk_score(location_data, weather_data, economic_data)
+
+
+# Tier tables for the temperature and precipitation risk lookups. Temperature
+# risk rises at both extremes; bisect_right on these breaks counts t >= 32,
+# t >= 40, t > 85 and t > 90 (the upper breaks are nudged to the next float).
+_TEMP_BREAKS = (32, 40, math.nextafter(85, math.inf), math.nextafter(90, math.inf))
+_TEMP_SCORES = (0.7, 0.5, 0.3, 0.5, 0.7)
+# bisect_left on these breaks counts p > 0.5, p > 1.0 and p > 2.0
+_PRECIP_BREAKS = (0.5, 1.0, 2.0)
+_PRECIP_SCORES = (0.2, 0.4, 0.6, 0.8)
+
+# Location keyword sets, each matched in a single scan
+_HIGH_CARBON_RE = re.compile(r'Texas|West Virginia|Wyoming')
+_COASTAL_RE = re.compile(r'coast|beach', re.IGNORECASE)
+_URBAN_RE = re.compile(r'city|urban', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _carbon_risk_for_location(location: str) -> float:
+    """Carbon transition risk for a location string"""
+    # High carbon regions face higher transition risks
+    if _HIGH_CARBON_RE.search(location) is not None:
+        return 0.7
+    else:
+        return 0.4
+
+
+@lru_cache(maxsize=4096)
+def _community_vulnerability_for_location(location: str) -> float:
+    """Community vulnerability for a location string"""
+    # Coastal areas and urban centers may have higher vulnerability
+    if _COASTAL_RE.search(location) is not None:
+        return 0.6
+    elif _URBAN_RE.search(location) is not None:
+        return 0.5
+    else:
+        return 0.3
+
+
+# Economic health is encoded to int8 before scoring; unknown values share the last code
+_ECONOMIC_HEALTH_CODES = {'weak': 0, 'moderate': 1}
+_INEQUALITY_BY_CODE = np.array([0.7, 0.5, 0.3])
+
+
+def _encode_economic_health(economic_health: pd.Series) -> np.ndarray:
+    """Map economic health labels to int8 codes indexing _INEQUALITY_BY_CODE"""
+    codes = economic_health.map(_ECONOMIC_HEALTH_CODES).fillna(len(_ECONOMIC_HEALTH_CODES))
+    return codes.to_numpy(dtype=np.int8)
+
+
+def _portfolio_kernel(temp: np.ndarray, precip: np.ndarray, base_risk: np.ndarray,
+                      carbon_risk: np.ndarray, community_risk: np.ndarray, econ_health_code: np.ndarray,
+                      health_safety: float, governance: float, weights: Tuple[float, float, float],
+                      out: np.ndarray) -> np.ndarray:
+    """Overall ESG score per row, accumulated in place into ``out``
+    
+    Sums are taken in the same order as the per-location path so the two
+    agree exactly.
+    """
+    env_weight, social_weight, gov_weight = weights
+    
+    # Environmental: mean of extreme weather, temperature, precipitation and carbon risk
+    np.multiply(base_risk, 1.2, out=out)
+    np.minimum(out, 1.0, out=out)
+    out += np.take(_TEMP_SCORES, np.searchsorted(_TEMP_BREAKS, temp, side='right'))
+    out += np.take(_PRECIP_SCORES, np.searchsorted(_PRECIP_BREAKS, precip, side='left'))
+    out += carbon_risk
+    out /= 4
+    out *= env_weight
+    
+    # Social: mean of community vulnerability, inequality and health/safety risk
+    social = community_risk + _INEQUALITY_BY_CODE[econ_health_code]
+    social += health_safety
+    social /= 3
+    social *= social_weight
+    out += social
+    
+    out += governance * gov_weight
+    return out
+
+
+# Layout templates for the dashboard bar charts; each render copies one and adds its bars
+_ESG_BAR_TEMPLATE = go.Figure(layout=go.Layout(
+    height=300,
+    title='ESG Risk Scores by Factor',
+    xaxis_title='ESG Factor',
+    yaxis_title='Risk Score',
+    coloraxis=dict(colorscale='RdYlGn_r', colorbar=dict(title='Risk Score'))
+))
+_SCENARIO_BAR_TEMPLATE = go.Figure(layout=go.Layout(
+    height=300,
+    title='Climate Scenario Risk Multipliers',
+    xaxis_title='Scenario',
+    yaxis_title='Risk Multiplier',
+    coloraxis=dict(colorscale='Reds', colorbar=dict(title='Risk Multiplier'))
+))
+
+# Display names for the ESG factor keys, title-cased once at import
+_FACTOR_DISPLAY_NAMES = MappingProxyType({
+    factor: factor.replace('_', ' ').title()
+    for factor in (
+        'extreme_weather', 'temperature_change', 'precipitation_change', 'carbon_transition',
+        'community_vulnerability', 'economic_inequality', 'health_safety',
+        'regulatory_framework', 'climate_governance', 'transparency'
+    )
+})
+
+
+def _factor_display_name(factor: str) -> str:
+    """Human-readable name for an ESG factor key"""
+    name = _FACTOR_DISPLAY_NAMES.get(factor)
+    return name if name is not None else factor.replace('_', ' ').title()
+
+
 class ESGClimateRiskFramework:
     """ESG framework for climate risk modeling in insurance"""
     
+    __slots__ = ('esg_weights', '_esg_weight_vec', 'climate_risk_categories', 'esg_metrics',
+                 '_high_carbon_re', '_coastal_re', '_urban_re')
+    
+    # Input-independent tables, shared read-only across calls
+    _CLIMATE_SCENARIOS = MappingProxyType({
+        'current': MappingProxyType({
+            'description': 'Current climate conditions',
+            'risk_multiplier': 1.0,
+            'timeframe': 'Present'
+        }),
+        'rcp45': MappingProxyType({
+            'description': 'Moderate climate change scenario (RCP 4.5)',
+            'risk_multiplier': 1.3,
+            'timeframe': '2030-2050'
+        }),
+        'rcp85': MappingProxyType({
+            'description': 'High climate change scenario (RCP 8.5)',
+            'risk_multiplier': 1.8,
+            'timeframe': '2050-2100'
+        })
+    })
+    
+    _COMPLIANCE_STATUS = MappingProxyType({
+        'tcfd_compliance': 'Partial',  # Task Force on Climate-related Financial Disclosures
+        'eu_taxonomy': 'Not Applicable',
+        'sec_climate_disclosure': 'In Progress',
+        'local_regulations': 'Compliant',
+        'overall_status': 'Good'
+    })
+    
+    _ENV_RECS = (
+        "Implement climate adaptation measures",
+        "Invest in renewable energy infrastructure",
+        "Develop flood and extreme weather resilience plans"
+    )
+    
+    _SOCIAL_RECS = (
+        "Strengthen community emergency preparedness",
+        "Support vulnerable population protection programs",
+        "Invest in social infrastructure resilience"
+    )
+    
+    _GOVERNANCE_RECS = (
+        "Enhance climate risk governance frameworks",
+        "Improve ESG reporting and transparency",
+        "Strengthen regulatory compliance programs"
+    )
+    
+    _ADAPTATION_MEASURES = (
+        "Implement early warning systems",
+        "Develop climate-resilient infrastructure",
+        "Create emergency response protocols",
+        "Invest in natural disaster preparedness"
+    )
+    
+    _VULNERABLE_GROUPS = (
+        "Elderly populations",
+        "Low-income communities",
+        "Coastal residents",
+        "Outdoor workers"
+    )
+    
+    _SOCIAL_INTERVENTIONS = (
+        "Community resilience building programs",
+        "Vulnerable population support systems",
+        "Public health preparedness initiatives",
+        "Economic support for climate adaptation"
+    )
+    
+    _GOVERNANCE_IMPROVEMENTS = (
+        "Establish climate risk committees",
+        "Implement ESG reporting frameworks",
+        "Develop climate scenario planning",
+        "Enhance stakeholder engagement"
+    )
+    
     def __init__(self):
         self.esg_weights = {
             'environmental': 0.5,  # Climate and environmental factors
             'social': 0.3,         # Social impact and community factors
             'governance': 0.2      # Regulatory and governance factors
         }
+        # (environmental, social, governance) weights, unpacked on the scoring paths
+        self._esg_weight_vec = (
+            self.esg_weights['environmental'],
+            self.esg_weights['social'],
+            self.esg_weights['governance']
+        )
         
         self.climate_risk_categories = {
             'physical_risks': ['extreme_weather', 'sea_level_rise', 'temperature_change', 'precipitation_change'],
@@ -47,24 +253,30 @@ class ESGClimateRiskFramework:
                 'stakeholder_engagement': 'Engagement with stakeholders on climate issues'
             }
         }
+        
+        # Location keyword sets, shared with the portfolio scoring path
+        self._high_carbon_re = _HIGH_CARBON_RE
+        self._coastal_re = _COASTAL_RE
+        self._urban_re = _URBAN_RE
     
     def calculate_esg_climate_risk_score(self, location_data: Dict, weather_data: Dict, economic_data: Dict) -> Dict[str, Any]:
         """Calculate comprehensive ESG climate risk score"""
+        return _cached_esg_climate_risk_score(self, location_data, weather_data, economic_data)
+    
+    def _compute_esg_climate_risk_score(self, location_data: Dict, weather_data: Dict, economic_data: Dict) -> Dict[str, Any]:
+        """Compute the ESG climate risk score without caching"""
         
-        # Environmental risk assessment
-        environmental_score = self._assess_environmental_risks(location_data, weather_data)
-        
-        # Social risk assessment
-        social_score = self._assess_social_risks(location_data, economic_data)
-        
-        # Governance risk assessment
-        governance_score = self._assess_governance_risks(location_data)
+        # Environmental, social and governance risk assessment
+        environmental_score, social_score, governance_score = self._assess_all_risks(
+            location_data, weather_data, economic_data
+        )
         
         # Calculate weighted overall score
+        env_weight, social_weight, gov_weight = self._esg_weight_vec
         overall_score = (
-            environmental_score['score'] * self.esg_weights['environmental'] +
-            social_score['score'] * self.esg_weights['social'] +
-            governance_score['score'] * self.esg_weights['governance']
+            environmental_score['score'] * env_weight +
+            social_score['score'] * social_weight +
+            governance_score['score'] * gov_weight
         )
         
         return {
@@ -78,87 +290,106 @@ class ESGClimateRiskFramework:
             'compliance_status': self._assess_regulatory_compliance(location_data)
         }
     
-    def _assess_environmental_risks(self, location_data: Dict, weather_data: Dict) -> Dict[str, Any]:
-        """Assess environmental climate risks"""
-        
-        # Physical climate risks
-        extreme_weather_risk = self._calculate_extreme_weather_risk(weather_data)
-        temperature_risk = self._calculate_temperature_risk(weather_data)
-        precipitation_risk = self._calculate_precipitation_risk(weather_data)
-        
-        # Transition risks
-        carbon_transition_risk = self._calculate_carbon_transition_risk(location_data)
+    def score_portfolio(self, loc_df: pd.DataFrame, wx_df: pd.DataFrame, econ_df: pd.DataFrame,
+                        quantize: bool = False) -> np.ndarray:
+        """Calculate overall ESG climate risk scores for a portfolio of policies
+        
+        Row i of each frame describes policy i. Reads the ``location``,
+        ``temperature``, ``precipitation``, ``overall_risk_score`` and
+        ``economic_health`` columns; missing columns or values fall back to the
+        same defaults as calculate_esg_climate_risk_score.
+        
+        With ``quantize=True`` the scores are returned as uint8 in 1/255 steps
+        for compact storage; use decode_scores to get floats back.
+        """
+        
+        n = len(loc_df)
+        location = self._column(loc_df, 'location', 'Unknown', n).astype(str)
+        temp = self._column(wx_df, 'temperature', 70, n).to_numpy(dtype=np.float64)
+        precip = self._column(wx_df, 'precipitation', 0, n).to_numpy(dtype=np.float64)
+        base_risk = self._column(wx_df, 'overall_risk_score', 0.3, n).to_numpy(dtype=np.float64)
+        economic_health = _encode_economic_health(self._column(econ_df, 'economic_health', 'moderate', n))
+        
+        carbon_risk = np.where(location.str.contains(self._high_carbon_re).to_numpy(), 0.7, 0.4)
+        community_risk = np.select(
+            [location.str.contains(self._coastal_re).to_numpy(),
+             location.str.contains(self._urban_re).to_numpy()],
+            [0.6, 0.5], default=0.3
+        )
         
+        scores = _portfolio_kernel(
+            temp, precip, base_risk, carbon_risk, community_risk, economic_health,
+            self._calculate_health_safety_risk({}),
+            # Governance factors are location independent
+            self._assess_all_risks({}, {}, {})[2]['score'],
+            self._esg_weight_vec,
+            np.empty(n)
+        )
+        return self.encode_scores(scores) if quantize else scores
+    
+    @staticmethod
+    def encode_scores(scores: np.ndarray) -> np.ndarray:
+        """Quantize [0, 1] scores to uint8 with an implicit 1/255 scale"""
+        return np.rint(np.clip(scores, 0.0, 1.0) * 255).astype(np.uint8)
+    
+    @staticmethod
+    def decode_scores(scores: np.ndarray) -> np.ndarray:
+        """Float32 scores from encode_scores output (within 1/510 of the originals)"""
+        return scores.astype(np.float32) * np.float32(1.0 / 255.0)
+    
+    @staticmethod
+    def _column(df: pd.DataFrame, name: str, default: Any, n: int) -> pd.Series:
+        """Column ``name`` of ``df`` with missing values replaced by ``default``"""
+        if name not in df:
+            return pd.Series([default] * n)
+        return df[name].fillna(default).reset_index(drop=True)
+    
+    def _assess_all_risks(self, location_data: Dict, weather_data: Dict,
+                          economic_data: Dict) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Assess environmental, social and governance climate risks in one pass"""
+        
+        # Environmental: physical climate risks and carbon transition risk
         environmental_factors = {
-            'extreme_weather': extreme_weather_risk,
-            'temperature_change': temperature_risk,
-            'precipitation_change': precipitation_risk,
-            'carbon_transition': carbon_transition_risk
+            'extreme_weather': self._calculate_extreme_weather_risk(weather_data),
+            'temperature_change': self._calculate_temperature_risk(weather_data),
+            'precipitation_change': self._calculate_precipitation_risk(weather_data),
+            'carbon_transition': self._calculate_carbon_transition_risk(location_data)
         }
         
-        # Calculate weighted environmental score
-        environmental_score = np.mean(list(environmental_factors.values()))
+        # Social: community vulnerability, economic inequality, health and safety
+        social_factors = {
+            'community_vulnerability': self._calculate_community_vulnerability(location_data),
+            'economic_inequality': self._calculate_inequality_impact(economic_data),
+            'health_safety': self._calculate_health_safety_risk(location_data)
+        }
         
-        return {
-            'score': environmental_score,
+        # Governance: regulatory strength, climate governance, transparency
+        governance_factors = {
+            'regulatory_framework': self._assess_regulatory_framework(location_data),
+            'climate_governance': self._assess_climate_governance(location_data),
+            'transparency': self._assess_transparency(location_data)
+        }
+        
+        environmental = {
+            'score': sum(environmental_factors.values()) / len(environmental_factors),
             'factors': environmental_factors,
             'key_risks': self._identify_key_environmental_risks(environmental_factors),
             'adaptation_measures': self._suggest_adaptation_measures(environmental_factors)
         }
-    
-    def _assess_social_risks(self, location_data: Dict, economic_data: Dict) -> Dict[str, Any]:
-        """Assess social climate risks"""
-        
-        # Community vulnerability
-        community_vulnerability = self._calculate_community_vulnerability(location_data)
-        
-        # Economic inequality impact
-        inequality_impact = self._calculate_inequality_impact(economic_data)
-        
-        # Health and safety risks
-        health_safety_risk = self._calculate_health_safety_risk(location_data)
-        
-        social_factors = {
-            'community_vulnerability': community_vulnerability,
-            'economic_inequality': inequality_impact,
-            'health_safety': health_safety_risk
-        }
-        
-        social_score = np.mean(list(social_factors.values()))
-        
-        return {
-            'score': social_score,
+        social = {
+            'score': sum(social_factors.values()) / len(social_factors),
             'factors': social_factors,
             'vulnerable_groups': self._identify_vulnerable_groups(location_data),
             'social_interventions': self._suggest_social_interventions(social_factors)
         }
-    
-    def _assess_governance_risks(self, location_data: Dict) -> Dict[str, Any]:
-        """Assess governance climate risks"""
-        
-        # Regulatory framework strength
-        regulatory_strength = self._assess_regulatory_framework(location_data)
-        
-        # Climate governance quality
-        governance_quality = self._assess_climate_governance(location_data)
-        
-        # Transparency and reporting
-        transparency_score = self._assess_transparency(location_data)
-        
-        governance_factors = {
-            'regulatory_framework': regulatory_strength,
-            'climate_governance': governance_quality,
-            'transparency': transparency_score
-        }
-        
-        governance_score = np.mean(list(governance_factors.values()))
-        
-        return {
-            'score': governance_score,
+        governance = {
+            'score': sum(governance_factors.values()) / len(governance_factors),
             'factors': governance_factors,
             'regulatory_gaps': self._identify_regulatory_gaps(governance_factors),
             'governance_improvements': self._suggest_governance_improvements(governance_factors)
         }
+        
+        return environmental, social, governance
     
     def _calculate_extreme_weather_risk(self, weather_data: Dict) -> float:
         """Calculate extreme weather risk score"""
@@ -174,51 +405,24 @@ class ESGClimateRiskFramework:
         current_temp = weather_data.get('current_conditions', {}).get('temperature', 70)
         
         # Risk increases with extreme temperatures
-        if current_temp > 90 or current_temp < 32:
-            return 0.7
-        elif current_temp > 85 or current_temp < 40:
-            return 0.5
-        else:
-            return 0.3
+        return _TEMP_SCORES[bisect_right(_TEMP_BREAKS, current_temp)]
     
     def _calculate_precipitation_risk(self, weather_data: Dict) -> float:
         """Calculate precipitation change risk"""
         precipitation = weather_data.get('current_conditions', {}).get('precipitation', 0)
         
         # Risk based on precipitation levels
-        if precipitation > 2.0:
-            return 0.8
-        elif precipitation > 1.0:
-            return 0.6
-        elif precipitation > 0.5:
-            return 0.4
-        else:
-            return 0.2
+        return _PRECIP_SCORES[bisect_left(_PRECIP_BREAKS, precipitation)]
     
     def _calculate_carbon_transition_risk(self, location_data: Dict) -> float:
         """Calculate carbon transition risk"""
         # Simulated based on location's carbon intensity
-        location = location_data.get('location', 'Unknown')
-        
-        # High carbon regions face higher transition risks
-        high_carbon_regions = ['Texas', 'West Virginia', 'Wyoming']
-        if any(region in location for region in high_carbon_regions):
-            return 0.7
-        else:
-            return 0.4
+        return _carbon_risk_for_location(location_data.get('location', 'Unknown'))
     
     def _calculate_community_vulnerability(self, location_data: Dict) -> float:
         """Calculate community vulnerability score"""
         # Simulated vulnerability based on location characteristics
-        location = location_data.get('location', 'Unknown')
-        
-        # Coastal areas and urban centers may have higher vulnerability
-        if 'coast' in location.lower() or 'beach' in location.lower():
-            return 0.6
-        elif 'city' in location.lower() or 'urban' in location.lower():
-            return 0.5
-        else:
-            return 0.3
+        return _community_vulnerability_for_location(location_data.get('location', 'Unknown'))
     
     def _calculate_inequality_impact(self, economic_data: Dict) -> float:
         """Calculate economic inequality impact"""
@@ -251,7 +455,9 @@ class ESGClimateRiskFramework:
         # Simulated transparency score
         return 0.8  # Good transparency
     
-    def _categorize_risk(self, risk_score: float) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _categorize_risk(risk_score: float) -> str:
         """Categorize overall ESG climate risk"""
         if risk_score >= 0.7:
             return "HIGH"
@@ -264,26 +470,8 @@ class ESGClimateRiskFramework:
     
     def _generate_climate_scenarios(self, location_data: Dict, weather_data: Dict) -> Dict[str, Any]:
         """Generate climate scenarios for risk modeling"""
-        
-        scenarios = {
-            'current': {
-                'description': 'Current climate conditions',
-                'risk_multiplier': 1.0,
-                'timeframe': 'Present'
-            },
-            'rcp45': {
-                'description': 'Moderate climate change scenario (RCP 4.5)',
-                'risk_multiplier': 1.3,
-                'timeframe': '2030-2050'
-            },
-            'rcp85': {
-                'description': 'High climate change scenario (RCP 8.5)',
-                'risk_multiplier': 1.8,
-                'timeframe': '2050-2100'
-            }
-        }
-        
-        return scenarios
+        # Plain dict copies keep the results picklable for st.cache_data
+        return {name: dict(info) for name, info in self._CLIMATE_SCENARIOS.items()}
     
     def _generate_esg_recommendations(self, env_score: Dict, social_score: Dict, gov_score: Dict) -> List[str]:
         """Generate ESG-based recommendations"""
@@ -292,82 +480,38 @@ class ESGClimateRiskFramework:
         
         # Environmental recommendations
         if env_score['score'] > 0.6:
-            recommendations.extend([
-                "Implement climate adaptation measures",
-                "Invest in renewable energy infrastructure",
-                "Develop flood and extreme weather resilience plans"
-            ])
+            recommendations.extend(self._ENV_RECS)
         
         # Social recommendations
         if social_score['score'] > 0.6:
-            recommendations.extend([
-                "Strengthen community emergency preparedness",
-                "Support vulnerable population protection programs",
-                "Invest in social infrastructure resilience"
-            ])
+            recommendations.extend(self._SOCIAL_RECS)
         
         # Governance recommendations
         if gov_score['score'] > 0.6:
-            recommendations.extend([
-                "Enhance climate risk governance frameworks",
-                "Improve ESG reporting and transparency",
-                "Strengthen regulatory compliance programs"
-            ])
+            recommendations.extend(self._GOVERNANCE_RECS)
         
         return recommendations
     
     def _assess_regulatory_compliance(self, location_data: Dict) -> Dict[str, Any]:
         """Assess regulatory compliance status"""
-        
-        return {
-            'tcfd_compliance': 'Partial',  # Task Force on Climate-related Financial Disclosures
-            'eu_taxonomy': 'Not Applicable',
-            'sec_climate_disclosure': 'In Progress',
-            'local_regulations': 'Compliant',
-            'overall_status': 'Good'
-        }
+        return dict(self._COMPLIANCE_STATUS)
     
     def _identify_key_environmental_risks(self, factors: Dict) -> List[str]:
         """Identify key environmental risks"""
-        key_risks = []
-        
-        for factor, score in factors.items():
-            if score > 0.6:
-                key_risks.append(factor.replace('_', ' ').title())
-        
-        return key_risks if key_risks else ['Low environmental risk exposure']
+        key_risks = [_factor_display_name(factor) for factor, score in factors.items() if score > 0.6]
+        return key_risks or ['Low environmental risk exposure']
     
     def _suggest_adaptation_measures(self, factors: Dict) -> List[str]:
         """Suggest climate adaptation measures"""
-        
-        measures = [
-            "Implement early warning systems",
-            "Develop climate-resilient infrastructure",
-            "Create emergency response protocols",
-            "Invest in natural disaster preparedness"
-        ]
-        
-        return measures
+        return list(self._ADAPTATION_MEASURES)
     
     def _identify_vulnerable_groups(self, location_data: Dict) -> List[str]:
         """Identify vulnerable population groups"""
-        
-        return [
-            "Elderly populations",
-            "Low-income communities",
-            "Coastal residents",
-            "Outdoor workers"
-        ]
+        return list(self._VULNERABLE_GROUPS)
     
     def _suggest_social_interventions(self, factors: Dict) -> List[str]:
         """Suggest social interventions"""
-        
-        return [
-            "Community resilience building programs",
-            "Vulnerable population support systems",
-            "Public health preparedness initiatives",
-            "Economic support for climate adaptation"
-        ]
+        return list(self._SOCIAL_INTERVENTIONS)
     
     def _identify_regulatory_gaps(self, factors: Dict) -> List[str]:
         """Identify regulatory gaps"""
@@ -384,48 +528,82 @@ class ESGClimateRiskFramework:
     
     def _suggest_governance_improvements(self, factors: Dict) -> List[str]:
         """Suggest governance improvements"""
-        
-        return [
-            "Establish climate risk committees",
-            "Implement ESG reporting frameworks",
-            "Develop climate scenario planning",
-            "Enhance stakeholder engagement"
-        ]
+        return list(self._GOVERNANCE_IMPROVEMENTS)
 
 class ESGDashboard:
     """Dashboard for ESG climate risk visualization"""
     
-    def __init__(self):
+    __slots__ = ('esg_framework', 'panels', 'esg_required', '_scenario_panel', '_compliance_panel')
+    
+    PANELS = ('summary', 'breakdown', 'scenarios', 'recommendations', 'compliance')
+    
+    def __init__(self, config: Optional[Dict[str, bool]] = None):
         self.esg_framework = ESGClimateRiskFramework()
+        
+        # Panels default to enabled; the ESG scores are only needed if one is shown
+        config = config or {}
+        self.panels = {panel: bool(config.get(panel, True)) for panel in self.PANELS}
+        self.esg_required = any(self.panels.values())
+        
+        # Scenario and compliance tables don't depend on the inputs; build their
+        # DataFrames and figure once and share them across dashboards
+        self._scenario_panel = _static_scenario_panel()
+        self._compliance_panel = _static_compliance_panel()
+    
+    @staticmethod
+    def _esg_input_hash(location_data: Dict, weather_data: Dict, economic_data: Dict) -> int:
+        """32-bit hash of the inputs the ESG scoring actually reads"""
+        current_conditions = weather_data.get('current_conditions', {})
+        key = (
+            location_data.get('location'),
+            current_conditions.get('temperature'),
+            current_conditions.get('precipitation'),
+            weather_data.get('risk_assessment', {}).get('overall_risk_score'),
+            economic_data.get('insurance_impact', {}).get('economic_health')
+        )
+        return hash(key) & 0xFFFFFFFF
     
     def display_esg_climate_dashboard(self, location_data: Dict, weather_data: Dict, economic_data: Dict):
         """Display comprehensive ESG climate risk dashboard"""
         
+        if not self.esg_required:
+            return
+        
         st.subheader("🌍 ESG Climate Risk Assessment")
         st.markdown("*Environmental, Social, and Governance climate risk analysis*")
         
-        # Calculate ESG risk scores
-        esg_results = self.esg_framework.calculate_esg_climate_risk_score(
-            location_data, weather_data, economic_data
-        )
+        # Calculate ESG risk scores, reusing the previous run's results if inputs are unchanged
+        input_hash = self._esg_input_hash(location_data, weather_data, economic_data)
+        esg_results = st.session_state.get('esg_results')
+        if esg_results is None or st.session_state.get('esg_input_hash') != input_hash:
+            esg_results = self.esg_framework.calculate_esg_climate_risk_score(
+                location_data, weather_data, economic_data
+            )
+            st.session_state['esg_input_hash'] = input_hash
+            st.session_state['esg_results'] = esg_results
         
         # Overall ESG risk summary
-        self._display_esg_summary(esg_results)
+        if self.panels['summary']:
+            self._display_esg_summary(esg_results)
         
         # Detailed ESG analysis
         col1, col2 = st.columns(2)
         
-        with col1:
-            self._display_esg_breakdown(esg_results)
+        if self.panels['breakdown']:
+            with col1:
+                self._display_esg_breakdown(esg_results)
         
-        with col2:
-            self._display_climate_scenarios(esg_results['climate_scenarios'])
+        if self.panels['scenarios']:
+            with col2:
+                self._display_climate_scenarios(esg_results['climate_scenarios'])
         
         # ESG recommendations
-        self._display_esg_recommendations(esg_results)
+        if self.panels['recommendations']:
+            self._display_esg_recommendations(esg_results)
         
         # Regulatory compliance
-        self._display_compliance_status(esg_results['compliance_status'])
+        if self.panels['compliance']:
+            self._display_compliance_status(esg_results['compliance_status'])
     
     def _display_esg_summary(self, esg_results: Dict):
         """Display ESG risk summary"""
@@ -483,64 +661,71 @@ class ESGDashboard:
             'Weight': [0.5, 0.3, 0.2]
         }
         
-        fig = px.bar(
-            esg_data,
-            x='ESG Factor',
-            y='Risk Score',
-            color='Risk Score',
-            color_continuous_scale='RdYlGn_r',
-            title="ESG Risk Scores by Factor"
-        )
-        fig.update_layout(height=300)
+        # Reuse the previous figure when the plotted data hasn't changed
+        fig_key = hash((tuple(esg_data['Risk Score']), tuple(esg_data['Weight'])))
+        fig = self._cached_figure('esg_bar_fig', fig_key)
+        if fig is None:
+            fig = go.Figure(_ESG_BAR_TEMPLATE)
+            fig.add_bar(
+                x=esg_data['ESG Factor'],
+                y=esg_data['Risk Score'],
+                marker=dict(color=esg_data['Risk Score'], coloraxis='coloraxis')
+            )
+            st.session_state['esg_bar_fig'] = (fig_key, fig)
         st.plotly_chart(fig, use_container_width=True)
         
         # Environmental factors detail
         with st.expander("🌱 Environmental Factors", expanded=False):
-            env_factors = esg_results['environmental']['factors']
-            for factor, score in env_factors.items():
-                st.progress(score, text=f"{factor.replace('_', ' ').title()}: {score:.2f}")
+            self._display_factor_scores(esg_results['environmental']['factors'])
         
         # Social factors detail
         with st.expander("👥 Social Factors", expanded=False):
-            social_factors = esg_results['social']['factors']
-            for factor, score in social_factors.items():
-                st.progress(score, text=f"{factor.replace('_', ' ').title()}: {score:.2f}")
+            self._display_factor_scores(esg_results['social']['factors'])
         
         # Governance factors detail
         with st.expander("⚖️ Governance Factors", expanded=False):
-            gov_factors = esg_results['governance']['factors']
-            for factor, score in gov_factors.items():
-                st.progress(score, text=f"{factor.replace('_', ' ').title()}: {score:.2f}")
+            self._display_factor_scores(esg_results['governance']['factors'])
+    
+    @staticmethod
+    def _display_factor_scores(factors: Dict[str, float]):
+        """Display factor scores as progress bars in a single table element"""
+        
+        df = pd.DataFrame({
+            'Factor': [_factor_display_name(factor) for factor in factors],
+            'Score': list(factors.values())
+        })
+        st.dataframe(
+            df,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'Score': st.column_config.ProgressColumn('Score', format='%.2f', min_value=0.0, max_value=1.0)
+            }
+        )
     
     def _display_climate_scenarios(self, scenarios: Dict):
         """Display climate scenarios"""
         
         st.markdown("### 🌡️ Climate Scenarios")
         
-        scenario_data = []
-        for scenario_name, scenario_info in scenarios.items():
-            scenario_data.append({
-                'Scenario': scenario_name.upper(),
-                'Risk Multiplier': scenario_info['risk_multiplier'],
-                'Timeframe': scenario_info['timeframe'],
-                'Description': scenario_info['description']
-            })
+        static_scenarios, df, fig = self._scenario_panel
+        if scenarios != static_scenarios:
+            df = _scenario_table(scenarios)
+            fig = _scenario_figure(df)
         
-        df = pd.DataFrame(scenario_data)
         st.dataframe(df, use_container_width=True)
         
         # Scenario impact visualization
-        fig = px.bar(
-            df,
-            x='Scenario',
-            y='Risk Multiplier',
-            color='Risk Multiplier',
-            color_continuous_scale='Reds',
-            title="Climate Scenario Risk Multipliers"
-        )
-        fig.update_layout(height=300)
         st.plotly_chart(fig, use_container_width=True)
     
+    @staticmethod
+    def _cached_figure(state_key: str, fig_key: int):
+        """Figure stored under ``state_key`` if it was built from data hashing to ``fig_key``"""
+        cached = st.session_state.get(state_key)
+        if cached is not None and cached[0] == fig_key:
+            return cached[1]
+        return None
+    
     def _display_esg_recommendations(self, esg_results: Dict):
         """Display ESG recommendations"""
         
@@ -566,20 +751,65 @@ class ESGDashboard:
         with st.expander("📋 Regulatory Compliance Status", expanded=False):
             st.markdown("### Compliance Framework Status")
             
-            compliance_data = []
-            for framework, status in compliance.items():
-                if framework != 'overall_status':
-                    compliance_data.append({
-                        'Framework': framework.replace('_', ' ').upper(),
-                        'Status': status
-                    })
-            
-            df = pd.DataFrame(compliance_data)
+            static_compliance, df = self._compliance_panel
+            if compliance != static_compliance:
+                df = _compliance_table(compliance)
             st.dataframe(df, use_container_width=True)
             
             overall_status = compliance.get('overall_status', 'Unknown')
             st.success(f"Overall Compliance Status: {overall_status}")
 
+def _scenario_table(scenarios: Dict) -> pd.DataFrame:
+    """Climate scenario table for display"""
+    
+    names, multipliers, timeframes, descriptions = [], [], [], []
+    for scenario_name, scenario_info in scenarios.items():
+        names.append(scenario_name.upper())
+        multipliers.append(scenario_info['risk_multiplier'])
+        timeframes.append(scenario_info['timeframe'])
+        descriptions.append(scenario_info['description'])
+    
+    return pd.DataFrame({
+        'Scenario': names,
+        'Risk Multiplier': multipliers,
+        'Timeframe': timeframes,
+        'Description': descriptions
+    })
+
+def _scenario_figure(df: pd.DataFrame) -> go.Figure:
+    """Bar chart of scenario risk multipliers"""
+    fig = go.Figure(_SCENARIO_BAR_TEMPLATE)
+    fig.add_bar(
+        x=df['Scenario'],
+        y=df['Risk Multiplier'],
+        marker=dict(color=df['Risk Multiplier'], coloraxis='coloraxis')
+    )
+    return fig
+
+def _compliance_table(compliance: Dict) -> pd.DataFrame:
+    """Compliance framework status table for display"""
+    
+    frameworks, statuses = [], []
+    for framework, status in compliance.items():
+        if framework != 'overall_status':
+            frameworks.append(framework.replace('_', ' ').upper())
+            statuses.append(status)
+    
+    return pd.DataFrame({'Framework': frameworks, 'Status': statuses})
+
+@lru_cache(maxsize=1)
+def _static_scenario_panel() -> Tuple[Dict, pd.DataFrame, go.Figure]:
+    """Default scenarios with their prebuilt table and figure"""
+    scenarios = {name: dict(info) for name, info in ESGClimateRiskFramework._CLIMATE_SCENARIOS.items()}
+    df = _scenario_table(scenarios)
+    return scenarios, df, _scenario_figure(df)
+
+@lru_cache(maxsize=1)
+def _static_compliance_panel() -> Tuple[Dict, pd.DataFrame]:
+    """Default compliance status with its prebuilt table"""
+    compliance = dict(ESGClimateRiskFramework._COMPLIANCE_STATUS)
+    return compliance, _compliance_table(compliance)
+
 def create_esg_demo():
     """Create ESG climate risk demo"""
     
@@ -6,22 +6,82 @@ dynamically choose and coordinate multiple agents based on task complexity,
 context, and available resources.
 """
 
+import functools
+import hashlib
+import heapq
 import json
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 import re
+import string
+
+import numpy as np
 
 from .openai_client import OpenAIClient
 from .search_integration import SearchIntegration, DynamicSearchAgent
 
+# Entity patterns matched against the task text, in extraction order
+_ENTITY_PATTERNS = [
+    ('location', re.compile(r'\b(?:in|at|near|from)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)')),
+    ('date', re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b')),
+    ('amount', re.compile(r'\$[\d,]+(?:\.\d{2})?')),
+    ('person', re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b'))
+]
+
+# Location and person patterns need an uppercase letter; translating the task
+# with this table leaves nothing behind when it has none
+_UPPERCASE_ENTITY_TYPES = frozenset({'location', 'person'})
+_LOWER_DROP_TABLE = str.maketrans('', '', string.ascii_lowercase + string.digits + string.whitespace + string.punctuation)
+
+# Task keywords that make a specific agent relevant, on top of its specializations
+_RELEVANCE_RULES = {
+    'Claims Processor': ('claim', 'filing', 'process', 'submit'),
+    'Claims Validation Agent': ('claim', 'verify', 'validate', 'check'),
+    'Risk Analyst': ('risk', 'danger', 'threat', 'safety', 'hazard'),
+    'Fraud Investigator': ('fraud', 'suspicious', 'investigate', 'verify'),
+    'Weather Analyst': ('weather', 'storm', 'flood', 'hurricane', 'climate'),
+    'Underwriter': ('quote', 'pricing', 'premium', 'coverage', 'approve'),
+    'ESG Specialist': ('environmental', 'sustainability', 'green', 'carbon'),
+    'Compliance Officer': ('compliance', 'regulation', 'legal', 'audit'),
+    'Data Analyst': ('analysis', 'data', 'pattern', 'trend', 'statistics')
+}
+
 class TaskComplexity(Enum):
     SIMPLE = "simple"
     MODERATE = "moderate" 
     COMPLEX = "complex"
     HIGHLY_COMPLEX = "highly_complex"
     CRITICAL = "critical"
+    
+    # Levels compare by declaration order; the string values stay the public form
+    def __init__(self, value):
+        self.rank = len(type(self).__members__)
+    
+    def __lt__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.rank < other.rank
+    
+    def __le__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.rank <= other.rank
+    
+    def __gt__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.rank > other.rank
+    
+    def __ge__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.rank >= other.rank
+
+# Budget and resource multipliers per complexity level, indexed by TaskComplexity.rank
+_COMPLEXITY_MULTIPLIERS = (1.0, 1.2, 1.5, 1.8, 2.0)
 
 class AgentTier(Enum):
     CORE = "core"           # Essential agents for basic tasks
@@ -29,7 +89,7 @@ class AgentTier(Enum):
     ADVANCED = "advanced"   # Complex analysis agents
     SUPPORT = "support"     # Supporting/auxiliary agents
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentCapability:
     agent_name: str
     tier: AgentTier
@@ -45,14 +105,33 @@ class HierarchicalFramework:
     Dynamic agent selection and coordination framework
     """
     
+    # AI complexity assessments shared across instances, keyed by task and context
+    _AI_CACHE_SIZE = 10_000
+    _ai_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+    
+    # Agent names picked before budget filtering, keyed by complexity and the
+    # relevance keywords found in the task
+    _SELECTION_CACHE_SIZE = 2048
+    _selection_cache: 'OrderedDict[Tuple[TaskComplexity, frozenset], Tuple[str, ...]]' = OrderedDict()
+    
     def __init__(self):
-        self.openai_client = OpenAIClient()
-        self.search_agent = DynamicSearchAgent()
-        self.search_integration = SearchIntegration()
-        
         # Define all available agents with their capabilities
         self.agent_registry = self._initialize_agent_registry()
         
+        # The registry is static (capabilities are frozen), so partition it by tier
+        # and convert each agent to its dict form once
+        self._agents_by_tier = {
+            tier: [agent for agent in self.agent_registry.values() if agent.tier == tier]
+            for tier in AgentTier
+        }
+        self._agent_dicts = {name: self._agent_to_dict(agent) for name, agent in self.agent_registry.items()}
+        self._relevance_tokens = {
+            name: frozenset(token for specialization in agent.specializations for token in specialization.split('_'))
+            | frozenset(_RELEVANCE_RULES.get(name, ()))
+            for name, agent in self.agent_registry.items()
+        }
+        self._relevance_universe = frozenset().union(*self._relevance_tokens.values())
+        
         # Task complexity analysis patterns
         self.complexity_indicators = {
             TaskComplexity.SIMPLE: {
@@ -86,6 +165,27 @@ class HierarchicalFramework:
                 'credit_threshold': 100
             }
         }
+        
+        # Union of complexity keywords and relevance tokens, scanned once per task
+        self._keyword_universe = tuple(sorted(
+            {kw for indicators in self.complexity_indicators.values() for kw in indicators['keywords']}
+            .union(*self._relevance_tokens.values())
+        ))
+        self._last_keyword_hits: Tuple[str, frozenset] = ('', frozenset())
+        self._last_task_lower: Tuple[str, str] = ('', '')
+    
+    # Network-backed clients are only built once a task actually needs them
+    @functools.cached_property
+    def openai_client(self) -> OpenAIClient:
+        return OpenAIClient()
+    
+    @functools.cached_property
+    def search_agent(self) -> DynamicSearchAgent:
+        return DynamicSearchAgent()
+    
+    @functools.cached_property
+    def search_integration(self) -> SearchIntegration:
+        return SearchIntegration()
     
     def _initialize_agent_registry(self) -> Dict[str, AgentCapability]:
         """Initialize the registry of all available agents"""
@@ -268,6 +368,38 @@ class HierarchicalFramework:
         Analyze task complexity using multiple factors
         """
         
+        analysis = self._prepare_complexity_analysis(task, context)
+        
+        # AI-based complexity assessment, unless critical keywords already settle it
+        ai_assessment = self._critical_keyword_assessment(analysis)
+        if ai_assessment is None:
+            ai_assessment = self._ai_assess_complexity(task, context, analysis)
+        
+        return self._finish_complexity_analysis(analysis, ai_assessment)
+    
+    def analyze_task_complexity_batch(self, tasks: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[TaskComplexity, Dict[str, Any]]]:
+        """
+        Analyze several (task, context) pairs, sharing one AI request for the uncached ones
+        """
+        
+        analyses = [self._prepare_complexity_analysis(task, context) for task, context in tasks]
+        ai_assessments = [self._critical_keyword_assessment(analysis) for analysis in analyses]
+        pending = [index for index, assessment in enumerate(ai_assessments) if assessment is None]
+        if pending:
+            batch = self._ai_assess_complexity_batch(
+                [(*tasks[index], analyses[index]) for index in pending]
+            )
+            for index, assessment in zip(pending, batch):
+                ai_assessments[index] = assessment
+        
+        return [
+            self._finish_complexity_analysis(analysis, ai_assessment)
+            for analysis, ai_assessment in zip(analyses, ai_assessments)
+        ]
+    
+    def _prepare_complexity_analysis(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect the rule-based complexity factors that feed the AI assessment"""
+        
         analysis = {
             'task': task,
             'context_factors': [],
@@ -278,7 +410,7 @@ class HierarchicalFramework:
             'final_complexity': TaskComplexity.MODERATE
         }
         
-        task_lower = task.lower()
+        task_lower = self._lower_task(task)
         
         # Count entities and complexity indicators
         entities = self._extract_entities(task, context)
@@ -286,8 +418,9 @@ class HierarchicalFramework:
         analysis['entities'] = entities
         
         # Check keyword matches for each complexity level
+        keyword_hits = self._keyword_hits(task_lower)
         for complexity, indicators in self.complexity_indicators.items():
-            matches = [kw for kw in indicators['keywords'] if kw in task_lower]
+            matches = [kw for kw in indicators['keywords'] if kw in keyword_hits]
             if matches:
                 analysis['keyword_matches'][complexity.value] = matches
         
@@ -304,8 +437,12 @@ class HierarchicalFramework:
         
         analysis['context_factors'] = context_factors
         
-        # AI-based complexity assessment
-        ai_assessment = self._ai_assess_complexity(task, context, analysis)
+        return analysis
+    
+    def _finish_complexity_analysis(self, analysis: Dict[str, Any],
+                                    ai_assessment: Dict[str, Any]) -> Tuple[TaskComplexity, Dict[str, Any]]:
+        """Combine the AI assessment with the rule-based factors"""
+        
         analysis['ai_assessment'] = ai_assessment
         
         # Determine final complexity
@@ -325,30 +462,29 @@ class HierarchicalFramework:
                 entities.append(f"{key}:{value}")
         
         # Extract from task using patterns
-        patterns = {
-            'location': r'\b(?:in|at|near|from)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            'date': r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
-            'amount': r'\$[\d,]+(?:\.\d{2})?',
-            'person': r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b'
-        }
-        
-        for entity_type, pattern in patterns.items():
-            matches = re.findall(pattern, task)
-            for match in matches:
-                entities.append(f"{entity_type}:{match}")
+        has_upper = bool(task.translate(_LOWER_DROP_TABLE))
+        for entity_type, pattern in _ENTITY_PATTERNS:
+            if not has_upper and entity_type in _UPPERCASE_ENTITY_TYPES:
+                continue
+            entities.extend(f"{entity_type}:{match}" for match in pattern.findall(task))
         
         return entities
     
     def _ai_assess_complexity(self, task: str, context: Dict[str, Any], analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Use AI to assess task complexity"""
         
+        cache_key = self._ai_cache_key(task, context)
+        cached = self._ai_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         prompt = f"""
         Analyze the complexity of this insurance task:
         
         Task: "{task}"
-        Context: {json.dumps(context, indent=2)}
-        Entities found: {analysis.get('entities', [])}
-        Context factors: {analysis.get('context_factors', [])}
+        Context: {json.dumps(context, separators=(',', ':'), default=str)}
+        Entities found: {json.dumps(analysis.get('entities', []), separators=(',', ':'))}
+        Context factors: {json.dumps(analysis.get('context_factors', []), separators=(',', ':'))}
         
         Assess complexity based on:
         1. Number of steps required
@@ -373,17 +509,122 @@ class HierarchicalFramework:
         try:
             response = self.openai_client.get_chat_completion(prompt)
             assessment = json.loads(response.get('response', '{}'))
+            if self._is_successful_response(response):
+                self._cache_ai_assessment(cache_key, assessment)
             return assessment
         except Exception as e:
-            return {
-                'complexity_score': 5,
-                'reasoning': f'AI assessment failed: {str(e)}',
-                'required_expertise': ['general'],
-                'external_data_needed': False,
-                'estimated_steps': 3,
-                'risk_level': 'medium',
-                'recommended_complexity': 'moderate'
-            }
+            return self._fallback_ai_assessment(e)
+    
+    def _ai_assess_complexity_batch(self, items: List[Tuple[str, Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Assess several tasks, sending all cache misses in a single AI request"""
+        
+        cache_keys = [self._ai_cache_key(task, context) for task, context, _ in items]
+        assessments: List[Optional[Dict[str, Any]]] = []
+        for cache_key in cache_keys:
+            cached = self._ai_cache.get(cache_key)
+            assessments.append(dict(cached) if cached is not None else None)
+        
+        # One prompt entry per distinct uncached task; repeats are served from the cache afterwards
+        pending = []
+        pending_keys = set()
+        for index, assessment in enumerate(assessments):
+            if assessment is None and cache_keys[index] not in pending_keys:
+                pending.append(index)
+                pending_keys.add(cache_keys[index])
+        if len(pending) > 1:
+            task_lines = "\n".join(
+                f"{position}. Task: \"{items[index][0]}\" | Context: {json.dumps(items[index][1], separators=(',', ':'), default=str)}"
+                f" | Entities: {json.dumps(items[index][2].get('entities', []), separators=(',', ':'))}"
+                f" | Context factors: {json.dumps(items[index][2].get('context_factors', []), separators=(',', ':'))}"
+                for position, index in enumerate(pending, 1)
+            )
+            prompt = f"""
+        Analyze the complexity of each of these {len(pending)} insurance tasks:
+        
+        {task_lines}
+        
+        Assess each task on steps required, domain expertise, external data needs,
+        risk level, time sensitivity and stakeholder involvement.
+        
+        Return a JSON array with one assessment per task, in the order given, each:
+        {{
+            "complexity_score": 1-10,
+            "reasoning": "explanation of complexity assessment",
+            "required_expertise": ["domain1", "domain2"],
+            "external_data_needed": true/false,
+            "estimated_steps": 1-15,
+            "risk_level": "low/medium/high/critical",
+            "recommended_complexity": "simple/moderate/complex/highly_complex/critical"
+        }}
+        """
+            
+            try:
+                response = self.openai_client.get_chat_completion(prompt)
+                batch = json.loads(response.get('response', '[]'))
+                if (self._is_successful_response(response) and isinstance(batch, list) and len(batch) == len(pending)
+                        and all(isinstance(assessment, dict) for assessment in batch)):
+                    for index, assessment in zip(pending, batch):
+                        self._cache_ai_assessment(cache_keys[index], assessment)
+                        assessments[index] = assessment
+            except Exception:
+                # Fall back to assessing the tasks one at a time
+                pass
+        
+        return [
+            assessment if assessment is not None else self._ai_assess_complexity(*items[index])
+            for index, assessment in enumerate(assessments)
+        ]
+    
+    @staticmethod
+    def _ai_cache_key(task: str, context: Dict[str, Any]) -> str:
+        """Cache key for an AI assessment; the prompt is fully determined by the task and context"""
+        return hashlib.blake2b(
+            json.dumps([task.strip(), context], sort_keys=True, default=str).encode(),
+            digest_size=16
+        ).hexdigest()
+    
+    @staticmethod
+    def _is_successful_response(response: Dict[str, Any]) -> bool:
+        """Whether a chat response carries real model output; only those assessments are cached"""
+        # A failed request either reports success=False or has no 'response' to parse,
+        # in which case the assessment is just the empty default
+        return bool(response.get('success', True)) and 'response' in response
+    
+    def _cache_ai_assessment(self, cache_key: str, assessment: Any):
+        """Remember a successful assessment, evicting the oldest entries first"""
+        if isinstance(assessment, dict):
+            self._ai_cache[cache_key] = dict(assessment)
+            if len(self._ai_cache) > self._AI_CACHE_SIZE:
+                self._ai_cache.popitem(last=False)
+    
+    @staticmethod
+    def _critical_keyword_assessment(analysis: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Assessment for tasks with critical keywords, which are critical whatever the AI says"""
+        critical_matches = analysis['keyword_matches'].get(TaskComplexity.CRITICAL.value)
+        if not critical_matches:
+            return None
+        return {
+            'complexity_score': 10,
+            'reasoning': f"Critical keywords found: {', '.join(critical_matches)}",
+            'required_expertise': ['emergency_handling'],
+            'external_data_needed': True,
+            'estimated_steps': 15,
+            'risk_level': 'critical',
+            'recommended_complexity': TaskComplexity.CRITICAL.value
+        }
+    
+    @staticmethod
+    def _fallback_ai_assessment(error: Exception) -> Dict[str, Any]:
+        """Default assessment used when the AI request fails"""
+        return {
+            'complexity_score': 5,
+            'reasoning': f'AI assessment failed: {str(error)}',
+            'required_expertise': ['general'],
+            'external_data_needed': False,
+            'estimated_steps': 3,
+            'risk_level': 'medium',
+            'recommended_complexity': 'moderate'
+        }
     
     def _determine_final_complexity(self, analysis: Dict[str, Any]) -> TaskComplexity:
         """Determine final complexity based on all factors"""
@@ -408,7 +649,7 @@ class HierarchicalFramework:
         
         # Increase complexity based on entity count
         if entity_count > 5:
-            if base_complexity.value in ['simple', 'moderate']:
+            if base_complexity <= TaskComplexity.MODERATE:
                 base_complexity = TaskComplexity.COMPLEX
         elif entity_count > 8:
             base_complexity = TaskComplexity.HIGHLY_COMPLEX
@@ -437,7 +678,7 @@ class HierarchicalFramework:
         
         # Get search context if needed
         search_context = None
-        if complexity in [TaskComplexity.COMPLEX, TaskComplexity.HIGHLY_COMPLEX, TaskComplexity.CRITICAL]:
+        if complexity >= TaskComplexity.COMPLEX:
             search_context = self.search_agent.get_real_time_context(
                 task, context.get('location')
             )
@@ -463,8 +704,8 @@ class HierarchicalFramework:
             'selected_agents': selected_agents,
             'optimized_sequence': optimized_sequence,
             'resource_allocation': resource_allocation,
-            'total_estimated_cost': sum(agent['credit_cost'] for agent in selected_agents),
-            'total_estimated_duration': max(agent['estimated_duration'] for agent in selected_agents),
+            'total_estimated_cost': resource_allocation['base_cost'],
+            'total_estimated_duration': resource_allocation['max_duration'],
             'framework_version': '2.0_hierarchical'
         }
     
@@ -472,109 +713,119 @@ class HierarchicalFramework:
                                    credit_budget: int, search_context: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Select agents based on complexity level"""
         
-        selected = []
-        task_lower = task.lower()
+        # Relevance only depends on which relevance keywords the task contains
+        task_lower = self._lower_task(task)
+        cache_key = (complexity, self._keyword_hits(task_lower) & self._relevance_universe)
+        agent_names = self._selection_cache.get(cache_key)
+        if agent_names is None:
+            agent_names = self._collect_agents_by_complexity(complexity, task_lower, context)
+            self._selection_cache[cache_key] = agent_names
+            if len(self._selection_cache) > self._SELECTION_CACHE_SIZE:
+                self._selection_cache.popitem(last=False)
+        else:
+            self._selection_cache.move_to_end(cache_key)
         
-        # Always include core agents for basic functionality
-        core_agents = [agent for agent in self.agent_registry.values() 
-                      if agent.tier == AgentTier.CORE]
+        # Filter by budget constraints (but be more generous for complex tasks)
+        filtered_agents = self._filter_by_budget(
+            [self._agent_dicts[name] for name in agent_names], credit_budget, complexity
+        )
         
-        for agent in core_agents:
-            selected.append(self._agent_to_dict(agent))
+        return filtered_agents
+    
+    def _collect_agents_by_complexity(self, complexity: TaskComplexity, task_lower: str,
+                                      context: Dict[str, Any]) -> Tuple[str, ...]:
+        """Names of the agents suited to the task and complexity, before budget filtering"""
         
-        # Add specialized agents based on task content and complexity
-        specialized_agents = [agent for agent in self.agent_registry.values() 
-                            if agent.tier == AgentTier.SPECIALIZED]
+        # Keyed by agent name, so re-adding an agent keeps its first position
+        selected: Dict[str, Dict[str, Any]] = {}
+        
+        # Always include core agents for basic functionality
+        for agent in self._agents_by_tier[AgentTier.CORE]:
+            selected[agent.agent_name] = self._agent_dicts[agent.agent_name]
         
-        for agent in specialized_agents:
+        # Add specialized agents based on task content and complexity
+        for agent in self._agents_by_tier[AgentTier.SPECIALIZED]:
             # For moderate+ complexity, be more inclusive
-            if complexity in [TaskComplexity.MODERATE, TaskComplexity.COMPLEX, TaskComplexity.HIGHLY_COMPLEX, TaskComplexity.CRITICAL]:
-                if self._is_agent_relevant(agent, task, context) or self._is_agent_useful_for_complexity(agent, complexity):
-                    selected.append(self._agent_to_dict(agent))
-            elif complexity == TaskComplexity.SIMPLE and self._is_agent_relevant(agent, task, context):
-                selected.append(self._agent_to_dict(agent))
+            if complexity >= TaskComplexity.MODERATE:
+                if self._is_agent_relevant(agent, task_lower, context) or self._is_agent_useful_for_complexity(agent, complexity):
+                    selected[agent.agent_name] = self._agent_dicts[agent.agent_name]
+            elif complexity == TaskComplexity.SIMPLE and self._is_agent_relevant(agent, task_lower, context):
+                selected[agent.agent_name] = self._agent_dicts[agent.agent_name]
         
         # Add advanced agents for complex tasks
-        if complexity in [TaskComplexity.COMPLEX, TaskComplexity.HIGHLY_COMPLEX, TaskComplexity.CRITICAL]:
-            advanced_agents = [agent for agent in self.agent_registry.values() 
-                             if agent.tier == AgentTier.ADVANCED]
-            
-            for agent in advanced_agents:
+        if complexity >= TaskComplexity.COMPLEX:
+            for agent in self._agents_by_tier[AgentTier.ADVANCED]:
                 # Include most advanced agents for complex tasks
-                if self._is_agent_relevant(agent, task, context) or complexity in [TaskComplexity.HIGHLY_COMPLEX, TaskComplexity.CRITICAL]:
-                    selected.append(self._agent_to_dict(agent))
+                if self._is_agent_relevant(agent, task_lower, context) or complexity >= TaskComplexity.HIGHLY_COMPLEX:
+                    selected[agent.agent_name] = self._agent_dicts[agent.agent_name]
         
         # Add support agents based on needs
-        support_agents = [agent for agent in self.agent_registry.values() 
-                         if agent.tier == AgentTier.SUPPORT]
-        
-        for agent in support_agents:
+        for agent in self._agents_by_tier[AgentTier.SUPPORT]:
             # Always include search agent for moderate+ tasks
             if agent.agent_name == 'Dynamic Search Agent' and complexity != TaskComplexity.SIMPLE:
-                selected.append(self._agent_to_dict(agent))
+                selected[agent.agent_name] = self._agent_dicts[agent.agent_name]
             # Include emergency agent for critical tasks
             elif agent.agent_name == 'Emergency Response Agent' and complexity == TaskComplexity.CRITICAL:
-                selected.append(self._agent_to_dict(agent))
+                selected[agent.agent_name] = self._agent_dicts[agent.agent_name]
             # Include QA for complex+ tasks
-            elif agent.agent_name == 'Quality Assurance Agent' and complexity in [TaskComplexity.COMPLEX, TaskComplexity.HIGHLY_COMPLEX, TaskComplexity.CRITICAL]:
-                selected.append(self._agent_to_dict(agent))
+            elif agent.agent_name == 'Quality Assurance Agent' and complexity >= TaskComplexity.COMPLEX:
+                selected[agent.agent_name] = self._agent_dicts[agent.agent_name]
             # Include coordinator for moderate+ tasks
             elif agent.agent_name == 'Workflow Coordinator' and complexity != TaskComplexity.SIMPLE:
-                selected.append(self._agent_to_dict(agent))
-        
-        # Remove duplicates
-        seen_agents = set()
-        unique_selected = []
-        for agent in selected:
-            if agent['agent_name'] not in seen_agents:
-                unique_selected.append(agent)
-                seen_agents.add(agent['agent_name'])
-        
-        # Filter by budget constraints (but be more generous for complex tasks)
-        filtered_agents = self._filter_by_budget(unique_selected, credit_budget, complexity)
+                selected[agent.agent_name] = self._agent_dicts[agent.agent_name]
         
-        return filtered_agents
+        return tuple(selected)
     
     def _is_agent_useful_for_complexity(self, agent: AgentCapability, complexity: TaskComplexity) -> bool:
         """Determine if an agent is useful for a given complexity level"""
         
         # For complex tasks, include more agents even if not directly relevant
-        if complexity in [TaskComplexity.COMPLEX, TaskComplexity.HIGHLY_COMPLEX, TaskComplexity.CRITICAL]:
+        if complexity >= TaskComplexity.COMPLEX:
             # Include most specialized and advanced agents
             if agent.tier in [AgentTier.SPECIALIZED, AgentTier.ADVANCED]:
                 return True
         
         # For highly complex and critical tasks, include almost all agents
-        if complexity in [TaskComplexity.HIGHLY_COMPLEX, TaskComplexity.CRITICAL]:
+        if complexity >= TaskComplexity.HIGHLY_COMPLEX:
             return True
         
         return False
     
-    def _is_agent_relevant(self, agent: AgentCapability, task: str, context: Dict[str, Any]) -> bool:
-        """Determine if an agent is relevant to the task"""
+    def _is_agent_relevant(self, agent: AgentCapability, task_lower: str, context: Dict[str, Any]) -> bool:
+        """Determine if an agent is relevant to the (lowercased) task"""
+        
+        # Specialization tokens and agent-specific relevance keywords
+        tokens = self._relevance_tokens.get(agent.agent_name)
+        if tokens is None:
+            return any(
+                keyword in task_lower
+                for specialization in agent.specializations
+                for keyword in specialization.split('_')
+            )
+        return not tokens.isdisjoint(self._keyword_hits(task_lower))
+    
+    def _lower_task(self, task: str) -> str:
+        """Lowercased task, shared by the analysis and selection of the same task"""
         
-        task_lower = task.lower()
+        last_task, last_lower = self._last_task_lower
+        if task == last_task:
+            return last_lower
         
-        # Check specialization relevance
-        for specialization in agent.specializations:
-            if any(keyword in task_lower for keyword in specialization.split('_')):
-                return True
+        task_lower = task.lower()
+        self._last_task_lower = (task, task_lower)
+        return task_lower
+    
+    def _keyword_hits(self, task_lower: str) -> frozenset:
+        """Keywords from the complexity and relevance sets that occur in the task"""
         
-        # Specific agent relevance rules
-        relevance_rules = {
-            'Claims Processor': ['claim', 'filing', 'process', 'submit'],
-            'Claims Validation Agent': ['claim', 'verify', 'validate', 'check'],
-            'Risk Analyst': ['risk', 'danger', 'threat', 'safety', 'hazard'],
-            'Fraud Investigator': ['fraud', 'suspicious', 'investigate', 'verify'],
-            'Weather Analyst': ['weather', 'storm', 'flood', 'hurricane', 'climate'],
-            'Underwriter': ['quote', 'pricing', 'premium', 'coverage', 'approve'],
-            'ESG Specialist': ['environmental', 'sustainability', 'green', 'carbon'],
-            'Compliance Officer': ['compliance', 'regulation', 'legal', 'audit'],
-            'Data Analyst': ['analysis', 'data', 'pattern', 'trend', 'statistics']
-        }
+        # A selection checks the same task many times; remember the last scan
+        last_task, last_hits = self._last_keyword_hits
+        if task_lower == last_task:
+            return last_hits
         
-        keywords = relevance_rules.get(agent.agent_name, [])
-        return any(keyword in task_lower for keyword in keywords)
+        hits = frozenset(kw for kw in self._keyword_universe if kw in task_lower)
+        self._last_keyword_hits = (task_lower, hits)
+        return hits
     
     def _agent_to_dict(self, agent: AgentCapability) -> Dict[str, Any]:
         """Convert AgentCapability to dictionary"""
@@ -592,23 +843,23 @@ class HierarchicalFramework:
     def _filter_by_budget(self, agents: List[Dict[str, Any]], budget: int, complexity: TaskComplexity = TaskComplexity.MODERATE) -> List[Dict[str, Any]]:
         """Filter agents based on budget constraints"""
         
-        # Sort by priority (core > specialized > advanced > support)
+        # Sort by priority (core > specialized > advanced > support), then cost;
+        # tiers and costs are packed into parallel arrays for a stable lexsort
         tier_priority = {'core': 1, 'specialized': 2, 'advanced': 3, 'support': 4}
-        agents.sort(key=lambda x: (tier_priority.get(x['tier'], 5), x['credit_cost']))
+        tiers = np.fromiter((tier_priority.get(agent['tier'], 5) for agent in agents), dtype=np.int8, count=len(agents))
+        costs = np.fromiter((agent['credit_cost'] for agent in agents), dtype=np.int64, count=len(agents))
+        order = np.lexsort((costs, tiers))
+        agents[:] = [agents[index] for index in order]
         
         selected = []
         total_cost = 0
         
         # For complex tasks, be more generous with budget allocation
-        budget_multiplier = {
-            TaskComplexity.SIMPLE: 1.0,
-            TaskComplexity.MODERATE: 1.2,
-            TaskComplexity.COMPLEX: 1.5,
-            TaskComplexity.HIGHLY_COMPLEX: 1.8,
-            TaskComplexity.CRITICAL: 2.0
-        }
+        effective_budget = int(budget * _COMPLEXITY_MULTIPLIERS[complexity.rank])
         
-        effective_budget = int(budget * budget_multiplier.get(complexity, 1.0))
+        # Everything fits: with non-negative costs every running total is within budget too
+        if len(agents) and costs.min() >= 0 and int(costs.sum()) <= effective_budget:
+            return list(agents)
         
         # Always include core agents regardless of budget
         core_agents = [agent for agent in agents if agent['tier'] == 'core']
@@ -622,7 +873,7 @@ class HierarchicalFramework:
             if total_cost + agent['credit_cost'] <= effective_budget:
                 selected.append(agent)
                 total_cost += agent['credit_cost']
-            elif complexity in [TaskComplexity.HIGHLY_COMPLEX, TaskComplexity.CRITICAL]:
+            elif complexity >= TaskComplexity.HIGHLY_COMPLEX:
                 # For very complex tasks, include essential agents even if slightly over budget
                 if agent['tier'] in ['specialized', 'advanced'] and total_cost + agent['credit_cost'] <= effective_budget * 1.2:
                     selected.append(agent)
@@ -633,55 +884,62 @@ class HierarchicalFramework:
     def _optimize_agent_sequence(self, agents: List[Dict[str, Any]], complexity: TaskComplexity) -> List[Dict[str, Any]]:
         """Optimize the sequence of agent execution"""
         
-        # Create dependency graph
-        agent_map = {agent['agent_name']: agent for agent in agents}
+        tier_priority = {'core': 1, 'specialized': 2, 'advanced': 3, 'support': 4}
+        
+        # Create dependency graph; a dependency outside the selection is never met
+        in_degree = [len(agent['dependencies']) for agent in agents]
+        dependents: Dict[str, List[int]] = {}
+        for index, agent in enumerate(agents):
+            for dep in agent['dependencies']:
+                dependents.setdefault(dep, []).append(index)
+        
+        # Topological sort (Kahn's algorithm); ready agents are ordered by tier
+        # priority, then by their position in the input
+        priority = [(tier_priority.get(agent['tier'], 5), index) for index, agent in enumerate(agents)]
+        ready = [priority[index] for index in range(len(agents)) if in_degree[index] == 0]
+        heapq.heapify(ready)
         
-        # Topological sort based on dependencies
         sorted_agents = []
-        remaining_agents = agents.copy()
-        
-        while remaining_agents:
-            # Find agents with no unmet dependencies
-            ready_agents = []
-            for agent in remaining_agents:
-                dependencies_met = all(
-                    dep in [a['agent_name'] for a in sorted_agents] 
-                    for dep in agent['dependencies']
-                )
-                if dependencies_met:
-                    ready_agents.append(agent)
-            
-            if not ready_agents:
-                # Break circular dependencies by adding remaining agents
-                ready_agents = remaining_agents
+        placed = [False] * len(agents)
+        completed_names = set()
+        
+        while len(sorted_agents) < len(agents):
+            while ready and placed[ready[0][1]]:
+                heapq.heappop(ready)
             
-            # Sort ready agents by tier priority
-            tier_priority = {'core': 1, 'specialized': 2, 'advanced': 3, 'support': 4}
-            ready_agents.sort(key=lambda x: tier_priority.get(x['tier'], 5))
+            if ready:
+                _, next_index = heapq.heappop(ready)
+            else:
+                # Break circular dependencies with the highest priority remaining agent
+                _, next_index = min(priority[index] for index in range(len(agents)) if not placed[index])
             
-            # Add the highest priority agent
-            next_agent = ready_agents[0]
+            next_agent = agents[next_index]
+            placed[next_index] = True
             sorted_agents.append(next_agent)
-            remaining_agents.remove(next_agent)
+            
+            name = next_agent['agent_name']
+            if name in completed_names:
+                continue
+            completed_names.add(name)
+            for dependent in dependents.get(name, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0 and not placed[dependent]:
+                    heapq.heappush(ready, priority[dependent])
         
         return sorted_agents
     
     def _calculate_resource_allocation(self, agents: List[Dict[str, Any]], complexity: TaskComplexity, budget: int) -> Dict[str, Any]:
         """Calculate resource allocation for agents"""
         
-        total_cost = sum(agent['credit_cost'] for agent in agents)
-        total_duration = sum(agent['estimated_duration'] for agent in agents)
+        # Costs and durations gathered in one pass as the columns of an (N, 2) array
+        columns = np.array(
+            [(agent['credit_cost'], agent['estimated_duration']) for agent in agents], dtype=np.int64
+        ).reshape(-1, 2)
+        total_cost, total_duration = (int(total) for total in columns.sum(axis=0))
+        max_duration = int(columns[:, 1].max()) if len(agents) else 0
         
         # Adjust based on complexity
-        complexity_multipliers = {
-            TaskComplexity.SIMPLE: 1.0,
-            TaskComplexity.MODERATE: 1.2,
-            TaskComplexity.COMPLEX: 1.5,
-            TaskComplexity.HIGHLY_COMPLEX: 1.8,
-            TaskComplexity.CRITICAL: 2.0
-        }
-        
-        multiplier = complexity_multipliers[complexity]
+        multiplier = _COMPLEXITY_MULTIPLIERS[complexity.rank]
         adjusted_cost = int(total_cost * multiplier)
         adjusted_duration = int(total_duration * multiplier)
         
@@ -690,6 +948,7 @@ class HierarchicalFramework:
             'base_cost': total_cost,
             'adjusted_cost': adjusted_cost,
             'base_duration': total_duration,
+            'max_duration': max_duration,
             'adjusted_duration': adjusted_duration,
             'budget_utilization': adjusted_cost / budget if budget > 0 else 0,
             'complexity_multiplier': multiplier,
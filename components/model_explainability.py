@@ -3,33 +3,189 @@ Model Explainability Component for Customer Transparency
 Provides clear explanations of AI decision-making processes
 """
 
+import datetime
 import plotly.graph_objects as go
 import plotly.express as px
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, Any, Tuple
 import streamlit as st
 
+# Static explanation content, shared by every dashboard instance
+_EXPLANATION_TEMPLATES = MappingProxyType({
+    'claims_processing': MappingProxyType({
+        'title': 'Claims Decision Explanation',
+        'factors': ('Weather Impact', 'Historical Data', 'Policy Terms', 'Damage Assessment'),
+        'description': 'Your claim decision was based on multiple factors analyzed by our AI system'
+    }),
+    'risk_assessment': MappingProxyType({
+        'title': 'Risk Score Explanation', 
+        'factors': ('Location Risk', 'Weather Patterns', 'Economic Factors', 'Historical Claims'),
+        'description': 'Your risk score reflects current conditions and historical patterns'
+    }),
+    'pricing': MappingProxyType({
+        'title': 'Premium Calculation Explanation',
+        'factors': ('Base Rate', 'Risk Adjustments', 'Market Conditions', 'Coverage Level'),
+        'description': 'Your premium is calculated using transparent, data-driven factors'
+    })
+})
+
+_CLAIMS_STEPS = (
+    "🔍 **Initial Assessment**: We analyzed your claim details and incident report",
+    "🌦️ **Weather Analysis**: We checked weather conditions at the time and location",
+    "📊 **Historical Comparison**: We compared with similar claims in our database",
+    "💰 **Damage Evaluation**: We assessed the reported damage using AI image analysis",
+    "⚖️ **Policy Review**: We verified coverage terms and policy limits",
+    "✅ **Final Decision**: We combined all factors for the final determination"
+)
+
+_RISK_STEPS = (
+    "📍 **Location Analysis**: We evaluated risks specific to your location",
+    "🌡️ **Climate Assessment**: We analyzed current and forecasted weather patterns",
+    "📈 **Economic Factors**: We considered current economic conditions affecting insurance",
+    "📋 **Historical Patterns**: We reviewed historical claims and incidents in your area",
+    "🎯 **Risk Modeling**: We applied our AI models to calculate your risk score",
+    "📊 **Final Score**: We combined all factors into your personalized risk assessment"
+)
+
+_GENERAL_PRINCIPLES = (
+    "Our AI system follows these key principles:",
+    "• **Transparency**: All decisions are based on clear, explainable factors",
+    "• **Fairness**: We use objective data without bias",
+    "• **Accuracy**: Multiple data sources ensure reliable decisions",
+    "• **Compliance**: All processes follow insurance regulations"
+)
+
+_CUSTOMER_RIGHTS = (
+    "✅ **Right to Explanation**: You can request detailed explanations of any decision",
+    "✅ **Right to Review**: You can request human review of AI decisions",
+    "✅ **Right to Appeal**: You can appeal decisions you believe are incorrect",
+    "✅ **Data Access**: You can request access to data used in your decision"
+)
+
+_TRANSPARENCY_FEATURES = (
+    "✅ Real-time data source monitoring",
+    "✅ Decision factor explanations",
+    "✅ Confidence score display",
+    "✅ Data quality indicators",
+    "✅ Customer rights information",
+    "✅ Human review options"
+)
+
+# Multi-line blocks are sent as a single markdown element, one paragraph per line
+_CLAIMS_STEPS_MD = "\n\n".join(_CLAIMS_STEPS)
+_RISK_STEPS_MD = "\n\n".join(_RISK_STEPS)
+_GENERAL_PRINCIPLES_MD = "\n\n".join(_GENERAL_PRINCIPLES)
+_CUSTOMER_RIGHTS_MD = "\n\n".join(_CUSTOMER_RIGHTS)
+_TRANSPARENCY_FEATURES_MD = "\n\n".join(_TRANSPARENCY_FEATURES)
+
+def _influence_color(influence: float) -> str:
+    """Red/yellow/green bar colour for a factor influence percentage"""
+    if influence < 33:
+        return '#d73027'
+    elif influence < 66:
+        return '#fee08b'
+    return '#1a9850'
+
+@st.cache_data(ttl=300, max_entries=64)
+def _factor_bar_figure(factors: Tuple[Tuple[str, float], ...]) -> go.Figure:
+    """Factor importance chart, memoized on the (factor, influence) pairs in display order"""
+    names = [name for name, _ in factors]
+    values = [value for _, value in factors]
+    
+    # Plain per-bar colours; a continuous colour scale would also ship a colorbar
+    fig = go.Figure(go.Bar(
+        x=names,
+        y=values,
+        marker_color=[_influence_color(value) for value in values],
+        hovertemplate="Factors=%{x}<br>Influence (%)=%{y}<extra></extra>"
+    ))
+    fig.update_layout(
+        title="Factor Influence on Decision",
+        xaxis_title='Factors',
+        yaxis_title='Influence (%)',
+        height=300,
+        showlegend=False
+    )
+    return fig
+
+@st.cache_data(ttl=300, max_entries=64)
+def _confidence_gauge_figure(confidence: float) -> go.Figure:
+    """Decision confidence gauge, memoized on the confidence score"""
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = confidence * 100,
+        title = {'text': "Decision Confidence"},
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkgreen"},
+            'steps': [
+                {'range': [0, 60], 'color': "lightgray"},
+                {'range': [60, 80], 'color': "yellow"},
+                {'range': [80, 100], 'color': "lightgreen"}
+            ]
+        }
+    ))
+    fig.update_layout(height=200)
+    return fig
+
+@st.cache_resource(max_entries=2)
+def _quality_trend_figure(hour_bucket: int) -> go.Figure:
+    """24-hour quality trend chart, built once per clock hour"""
+    
+    # Simulated trend data
+    dates = [datetime.datetime.now() - datetime.timedelta(hours=i) for i in range(24, 0, -1)]
+    quality_scores = [0.85 + (i % 5) * 0.03 for i in range(24)]
+    
+    trend_df = pd.DataFrame({
+        'Time': dates,
+        'Quality Score': quality_scores
+    })
+    
+    fig = px.line(
+        trend_df,
+        x='Time',
+        y='Quality Score',
+        title="Data Quality Trend (Last 24 Hours)",
+        range_y=[0.7, 1.0]
+    )
+    fig.update_layout(height=300)
+    return fig
+
+# st.fragment arrived in Streamlit 1.37; older versions rerun the whole script as before
+_fragment = getattr(st, "fragment", lambda func: func)
+
+@_fragment
+def _customer_rights_fragment():
+    """Customer rights panel with its request buttons"""
+    
+    with st.expander("⚖️ Your Rights & Options", expanded=False):
+        st.markdown("### Your Rights")
+        st.markdown(_CUSTOMER_RIGHTS_MD)
+        
+        st.markdown("### What You Can Do")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if st.button("📞 Request Human Review"):
+                st.success("Human review request submitted!")
+        
+        with col2:
+            if st.button("📄 Get Detailed Report"):
+                st.success("Detailed report will be emailed to you!")
+        
+        with col3:
+            if st.button("❓ Ask Questions"):
+                st.success("Customer service will contact you!")
+
 class ModelExplainabilityDashboard:
     """Dashboard for explaining AI model decisions to customers"""
     
     def __init__(self):
-        self.explanation_templates = {
-            'claims_processing': {
-                'title': 'Claims Decision Explanation',
-                'factors': ['Weather Impact', 'Historical Data', 'Policy Terms', 'Damage Assessment'],
-                'description': 'Your claim decision was based on multiple factors analyzed by our AI system'
-            },
-            'risk_assessment': {
-                'title': 'Risk Score Explanation', 
-                'factors': ['Location Risk', 'Weather Patterns', 'Economic Factors', 'Historical Claims'],
-                'description': 'Your risk score reflects current conditions and historical patterns'
-            },
-            'pricing': {
-                'title': 'Premium Calculation Explanation',
-                'factors': ['Base Rate', 'Risk Adjustments', 'Market Conditions', 'Coverage Level'],
-                'description': 'Your premium is calculated using transparent, data-driven factors'
-            }
-        }
+        self.explanation_templates = _EXPLANATION_TEMPLATES
     
     def display_customer_explanation(self, decision_type: str, decision_data: Dict[str, Any]):
         """Display customer-friendly explanation of AI decision"""
@@ -49,16 +205,8 @@ class ModelExplainabilityDashboard:
             st.markdown("### 📊 Key Decision Factors")
             factors_data = self._extract_decision_factors(decision_data, template['factors'])
             
-            # Create factor importance chart
-            fig = px.bar(
-                x=list(factors_data.keys()),
-                y=list(factors_data.values()),
-                title="Factor Influence on Decision",
-                labels={'x': 'Factors', 'y': 'Influence (%)'},
-                color=list(factors_data.values()),
-                color_continuous_scale='RdYlGn'
-            )
-            fig.update_layout(height=300, showlegend=False)
+            # Create factor importance chart; reruns with the same factors reuse it
+            fig = _factor_bar_figure(tuple(factors_data.items()))
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
@@ -68,22 +216,7 @@ class ModelExplainabilityDashboard:
             data_quality = decision_data.get('data_quality_score', 0.90)
             
             # Confidence gauge
-            fig_conf = go.Figure(go.Indicator(
-                mode = "gauge+number",
-                value = confidence * 100,
-                title = {'text': "Decision Confidence"},
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                gauge = {
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkgreen"},
-                    'steps': [
-                        {'range': [0, 60], 'color': "lightgray"},
-                        {'range': [60, 80], 'color': "yellow"},
-                        {'range': [80, 100], 'color': "lightgreen"}
-                    ]
-                }
-            ))
-            fig_conf.update_layout(height=200)
+            fig_conf = _confidence_gauge_figure(confidence)
             st.plotly_chart(fig_conf, use_container_width=True)
             
             st.metric("Data Quality", f"{data_quality:.1%}", "High quality sources")
@@ -94,7 +227,7 @@ class ModelExplainabilityDashboard:
         # Customer rights and options
         self._display_customer_rights()
     
-    def _extract_decision_factors(self, decision_data: Dict, factor_names: List[str]) -> Dict[str, float]:
+    def _extract_decision_factors(self, decision_data: Dict, factor_names: Tuple[str, ...]) -> Dict[str, float]:
         """Extract and normalize decision factors for visualization"""
         factors = {}
         
@@ -115,8 +248,8 @@ class ModelExplainabilityDashboard:
         remaining_factors = [f for f in factor_names if f not in factors]
         remaining_weight = max(0, 100 - sum(factors.values()))
         
-        for i, factor in enumerate(remaining_factors):
-            factors[factor] = remaining_weight / len(remaining_factors) if remaining_factors else 15
+        if remaining_factors:
+            factors.update(dict.fromkeys(remaining_factors, remaining_weight / len(remaining_factors)))
         
         return factors
     
@@ -137,75 +270,28 @@ class ModelExplainabilityDashboard:
             st.markdown("### 📊 Data Sources")
             data_sources = decision_data.get('data_sources_used', ['Policy Database', 'Weather API', 'Historical Claims'])
             
-            for source in data_sources:
-                st.markdown(f"✅ {source}")
+            st.markdown("\n\n".join(f"✅ {source}" for source in data_sources))
     
     def _explain_claims_process(self, decision_data: Dict):
         """Explain claims processing decision"""
         
-        steps = [
-            "🔍 **Initial Assessment**: We analyzed your claim details and incident report",
-            "🌦️ **Weather Analysis**: We checked weather conditions at the time and location",
-            "📊 **Historical Comparison**: We compared with similar claims in our database",
-            "💰 **Damage Evaluation**: We assessed the reported damage using AI image analysis",
-            "⚖️ **Policy Review**: We verified coverage terms and policy limits",
-            "✅ **Final Decision**: We combined all factors for the final determination"
-        ]
-        
-        for step in steps:
-            st.markdown(step)
-            st.markdown("")
+        st.markdown(_CLAIMS_STEPS_MD)
     
     def _explain_risk_process(self, decision_data: Dict):
         """Explain risk assessment decision"""
         
-        steps = [
-            "📍 **Location Analysis**: We evaluated risks specific to your location",
-            "🌡️ **Climate Assessment**: We analyzed current and forecasted weather patterns",
-            "📈 **Economic Factors**: We considered current economic conditions affecting insurance",
-            "📋 **Historical Patterns**: We reviewed historical claims and incidents in your area",
-            "🎯 **Risk Modeling**: We applied our AI models to calculate your risk score",
-            "📊 **Final Score**: We combined all factors into your personalized risk assessment"
-        ]
-        
-        for step in steps:
-            st.markdown(step)
-            st.markdown("")
+        st.markdown(_RISK_STEPS_MD)
     
     def _explain_general_process(self, decision_data: Dict):
         """Explain general decision process"""
         
-        st.markdown("Our AI system follows these key principles:")
-        st.markdown("• **Transparency**: All decisions are based on clear, explainable factors")
-        st.markdown("• **Fairness**: We use objective data without bias")
-        st.markdown("• **Accuracy**: Multiple data sources ensure reliable decisions")
-        st.markdown("• **Compliance**: All processes follow insurance regulations")
+        st.markdown(_GENERAL_PRINCIPLES_MD)
     
     def _display_customer_rights(self):
         """Display customer rights and options"""
         
-        with st.expander("⚖️ Your Rights & Options", expanded=False):
-            st.markdown("### Your Rights")
-            st.markdown("✅ **Right to Explanation**: You can request detailed explanations of any decision")
-            st.markdown("✅ **Right to Review**: You can request human review of AI decisions")
-            st.markdown("✅ **Right to Appeal**: You can appeal decisions you believe are incorrect")
-            st.markdown("✅ **Data Access**: You can request access to data used in your decision")
-            
-            st.markdown("### What You Can Do")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                if st.button("📞 Request Human Review"):
-                    st.success("Human review request submitted!")
-            
-            with col2:
-                if st.button("📄 Get Detailed Report"):
-                    st.success("Detailed report will be emailed to you!")
-            
-            with col3:
-                if st.button("❓ Ask Questions"):
-                    st.success("Customer service will contact you!")
+        # A fragment, so the request buttons rerun only this panel, not the charts above
+        _customer_rights_fragment()
 
 class DataQualityIndicator:
     """Component for displaying data quality and transparency metrics"""
@@ -257,21 +343,21 @@ class DataQualityIndicator:
         # Individual source quality
         st.markdown("### 🔍 Data Source Details")
         
-        source_data = []
-        for source_name, source_info in data_sources.items():
-            quality_score = source_info.get('quality_score', 0.8)
-            status = "Active" if source_info.get('active', True) else "Inactive"
-            last_check = source_info.get('last_check', "1 min ago")
-            
-            source_data.append({
-                'Data Source': source_name,
-                'Quality Score': f"{quality_score:.1%}",
-                'Status': status,
-                'Last Check': last_check,
-                'Records': source_info.get('record_count', 'N/A')
-            })
-        
-        df = pd.DataFrame(source_data)
+        # Built column by column rather than as one dict per row
+        quality_scores, statuses, last_checks, records = [], [], [], []
+        for source_info in data_sources.values():
+            quality_scores.append(source_info.get('quality_score', 0.8))
+            statuses.append("Active" if source_info.get('active', True) else "Inactive")
+            last_checks.append(source_info.get('last_check', "1 min ago"))
+            records.append(source_info.get('record_count', 'N/A'))
+        
+        df = pd.DataFrame({
+            'Data Source': list(data_sources),
+            'Quality Score': [f"{quality_score:.1%}" for quality_score in quality_scores],
+            'Status': statuses,
+            'Last Check': last_checks,
+            'Records': records
+        })
         st.dataframe(df, use_container_width=True)
         
         # Quality trends
@@ -285,8 +371,11 @@ class DataQualityIndicator:
         if not data_sources:
             return 0.0
         
-        total_quality = sum(source.get('quality_score', 0.8) for source in data_sources.values())
-        return total_quality / len(data_sources)
+        quality_scores = np.fromiter(
+            (source.get('quality_score', 0.8) for source in data_sources.values()),
+            dtype=np.float64, count=len(data_sources)
+        )
+        return float(quality_scores.mean())
     
     def _get_quality_color(self, quality_score: float) -> str:
         """Get color based on quality score"""
@@ -313,25 +402,9 @@ class DataQualityIndicator:
     def _display_quality_trends(self):
         """Display quality trends over time"""
         
-        # Simulated trend data
-        import datetime
-        dates = [datetime.datetime.now() - datetime.timedelta(hours=i) for i in range(24, 0, -1)]
-        quality_scores = [0.85 + (i % 5) * 0.03 for i in range(24)]
-        
-        trend_df = pd.DataFrame({
-            'Time': dates,
-            'Quality Score': quality_scores
-        })
-        
-        fig = px.line(
-            trend_df,
-            x='Time',
-            y='Quality Score',
-            title="Data Quality Trend (Last 24 Hours)",
-            range_y=[0.7, 1.0]
-        )
-        fig.update_layout(height=300)
-        st.plotly_chart(fig, use_container_width=True)
+        # The hourly series only moves once an hour, so reruns share the figure
+        hour_bucket = int(datetime.datetime.now().timestamp() // 3600)
+        st.plotly_chart(_quality_trend_figure(hour_bucket), use_container_width=True)
     
     def _display_transparency_metrics(self, data_sources: Dict):
         """Display transparency and explainability metrics"""
@@ -361,17 +434,7 @@ class DataQualityIndicator:
             with col2:
                 st.markdown("### 🎯 Transparency Features")
                 
-                transparency_features = [
-                    "✅ Real-time data source monitoring",
-                    "✅ Decision factor explanations",
-                    "✅ Confidence score display",
-                    "✅ Data quality indicators",
-                    "✅ Customer rights information",
-                    "✅ Human review options"
-                ]
-                
-                for feature in transparency_features:
-                    st.markdown(feature)
+                st.markdown(_TRANSPARENCY_FEATURES_MD)
 
 def create_customer_explanation_demo():
     """Create a demo of customer explanation features"""
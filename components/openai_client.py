@@ -1,19 +1,65 @@
 import os
-import openai
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dotenv import load_dotenv
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-# Load environment variables from .env file
-load_dotenv()
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load environment variables from .env file, once, when the first client is created"""
+    load_dotenv()
+
+@lru_cache(maxsize=1)
+def _openai():
+    """The openai package, imported on the first chat request rather than at app start-up"""
+    import openai
+    return openai
+
+# Completions are reused for identical prompts within the same hour
+_CHAT_CACHE_TTL = 3600
+
+@lru_cache(maxsize=512)
+def _cached_chat(prompt: str, model: str, ttl_bucket: int) -> str:
+    """Chat completion content for a prompt; failed requests raise and are not cached"""
+    response = _openai().chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": prompt}
+        ]
+    )
+    return response.choices[0].message.content
+
+# Placeholder news and travel advisories, keyed by the country they cover
+_NEWS_FIXTURES = {
+    "Iran": (
+        {
+            "title": "Iran's Latest Political Developments",
+            "source": "Reuters",
+            "date": "2025-07-03",
+            "summary": "Recent reports indicate ongoing diplomatic discussions and internal policy shifts in Iran."
+        },
+        {
+            "title": "Economic Sanctions and Their Impact on Iran",
+            "source": "Bloomberg",
+            "date": "2025-07-02",
+            "summary": "Analysis of the current economic situation in Iran under international sanctions."
+        }
+    )
+}
+
+_ADVISORY_FIXTURES = {
+    "Iran": "High degree of caution due to regional tensions and internal security concerns. Review your travel insurance. Avoid non-essential travel to certain areas."
+}
 
 class OpenAIClient:
     def __init__(self):
         # Retrieve API key from environment variable
+        _load_env()
         self.api_key = os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not found in environment variables. Please set it in your .env file.")
-        
-        openai.api_key = self.api_key
 
     def get_realtime_news(self, query: str, num_results: int = 5) -> Dict[str, Any]:
         """Fetches real-time news using OpenAI (simulated for now, would integrate with a news API)"""
@@ -34,25 +80,14 @@ class OpenAIClient:
             # )
             # return {"success": True, "news_summary": response.choices[0].message.content}
 
-            # Placeholder for real-time news for Iran
-            if "Iran" in query:
+            # Placeholder real-time news for countries with fixtures; articles are copied
+            # so callers can't alter the shared fixtures
+            articles = next((articles for country, articles in _NEWS_FIXTURES.items() if country in query), None)
+            if articles is not None:
                 return {
                     "success": True,
                     "query": query,
-                    "results": [
-                        {
-                            "title": "Iran's Latest Political Developments",
-                            "source": "Reuters",
-                            "date": "2025-07-03",
-                            "summary": "Recent reports indicate ongoing diplomatic discussions and internal policy shifts in Iran."
-                        },
-                        {
-                            "title": "Economic Sanctions and Their Impact on Iran",
-                            "source": "Bloomberg",
-                            "date": "2025-07-02",
-                            "summary": "Analysis of the current economic situation in Iran under international sanctions."
-                        }
-                    ]
+                    "results": [dict(article) for article in articles]
                 }
             else:
                 return {
@@ -76,11 +111,12 @@ class OpenAIClient:
             # Similar to news, this would involve calling a real travel advisory API
             # and potentially using OpenAI to process or reformat the information.
 
-            if country == "Iran":
+            advisory = _ADVISORY_FIXTURES.get(country)
+            if advisory is not None:
                 return {
                     "success": True,
                     "country": country,
-                    "advisory": "High degree of caution due to regional tensions and internal security concerns. Review your travel insurance. Avoid non-essential travel to certain areas.",
+                    "advisory": advisory,
                     "last_updated": "2025-07-03"
                 }
             else:
@@ -96,15 +132,17 @@ class OpenAIClient:
     def get_chat_completion(self, prompt: str) -> Dict[str, Any]:
         """Gets a chat completion from OpenAI's GPT model."""
         try:
-            response = openai.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            return {"success": True, "response": response.choices[0].message.content}
+            _openai().api_key = self.api_key
+            content = _cached_chat(prompt, "gpt-3.5-turbo", int(time.time() // _CHAT_CACHE_TTL))
+            return {"success": True, "response": content}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-
+    def get_chat_completions(self, prompts: List[str], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """Gets chat completions for several independent prompts concurrently, in prompt order."""
+        if len(prompts) < 2:
+            return [self.get_chat_completion(prompt) for prompt in prompts]
+        
+        # Requests are network-bound, so overlapping them turns the sum of latencies into roughly the max
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as executor:
+            return list(executor.map(self.get_chat_completion, prompts))